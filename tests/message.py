@@ -19,6 +19,11 @@ class Message:
     FRAME_TIMESTAMP_ATTR_NAME = 'frame_timestamp'
     FRAME_ATTR_NAME = 'frame'
 
+    # Pixels of the frame are transferred as big-endian 32-bit floats
+    FRAME_WIRE_DTYPE = np.dtype('>f4')
+    # Precompiled structure of the message header (message type, payload length)
+    HEADER_STRUCT = struct.Struct(">BI")
+
     @unique
     class Type(Enum):
         INVALID = 0
@@ -142,7 +147,7 @@ class Message:
 
         t = Message.Type
         already_read = 0
-        if(msg.msg_type in [t.OK, t.GET_CAMERA_LIST, t.CLOSE_CAMERA, t.GET_FRAME]):
+        if(msg.msg_type in [t.OK, t.GET_CAMERA_LIST, t.CLOSE_CAMERA, t.GET_FRAME, t.START_CONTINUOUS_GRABBING, t.STOP_CONTINUOUS_GRABBING]):
             pass
 
         elif(msg.msg_type == t.ERROR):
@@ -197,8 +202,7 @@ class Message:
             raise ValueError(
                 f"Deserialization of the message is finished, but no all bytes in payload were used. "
                 f"payload_length={payload_length}, number of read bytes={already_read}, message type={msg.msg_type}")
-        msg.__buffer = struct.pack(
-            f">BI",
+        msg.__buffer = Message.HEADER_STRUCT.pack(
             message_type_value,
             payload_length) + payload
         return msg
@@ -223,9 +227,9 @@ class Message:
                 "Parameter message_type must be type Message.Type")
         msg = Message()
         msg.msg_type = message_type
-        msg.__buffer = struct.pack(">B", msg.msg_type.value)
 
         payload_content = bytes()
+        frame = None
         t = Message.Type
         if(msg.msg_type in [t.OK, t.GET_CAMERA_LIST, t.CLOSE_CAMERA, t.GET_FRAME, t.START_CONTINUOUS_GRABBING, t.STOP_CONTINUOUS_GRABBING]):
             pass
@@ -293,13 +297,26 @@ class Message:
                 frame_height, frame_width = frame.shape
                 payload_content += struct.pack(f">HH",
                                                frame_height, frame_width)
-                payload_content += struct.pack(
-                    f">{frame_height*frame_width}f", *frame.flatten())
 
         else:
             raise ValueError(f"Unknown message type {msg.msg_type}")
 
-        msg.__buffer += struct.pack(f">I", len(payload_content))
-        msg.__buffer += struct.pack(f">{len(payload_content)}B",
-                                    *payload_content)
+        # Whole message is written into one preallocated buffer, the frame is
+        # byte-swapped to the wire format directly into its place
+        header_size = Message.HEADER_STRUCT.size
+        payload_length = len(payload_content)
+        if(frame is not None):
+            payload_length += frame.size * Message.FRAME_WIRE_DTYPE.itemsize
+        msg.__buffer = bytearray(header_size + payload_length)
+        Message.HEADER_STRUCT.pack_into(
+            msg.__buffer, 0, msg.msg_type.value, payload_length)
+        msg.__buffer[header_size:header_size +
+                     len(payload_content)] = payload_content
+        if(frame is not None):
+            np.frombuffer(
+                msg.__buffer,
+                dtype=Message.FRAME_WIRE_DTYPE,
+                count=frame.size,
+                offset=header_size + len(payload_content)).reshape(
+                frame.shape)[...] = frame
         return msg
@@ -0,0 +1,54 @@
+from wrpclient.driver import WRPProtocol
+from wrpclient.message import Message
+import pytest
+import numpy as np
+import asyncio
+
+
+class FakeTransport(asyncio.Transport):
+    def __init__(self):
+        super().__init__()
+        self.reading_paused = False
+
+    def pause_reading(self):
+        self.reading_paused = True
+
+    def resume_reading(self):
+        self.reading_paused = False
+
+    def close(self):
+        pass
+
+
+def feed(protocol, data, chunk_sizes):
+    position = 0
+    while(position < len(data)):
+        buffer = protocol.get_buffer(-1)
+        nbytes = min(len(buffer), np.random.choice(chunk_sizes), len(data) - position)
+        buffer[:nbytes] = data[position:position + nbytes]
+        protocol.buffer_updated(nbytes)
+        position += nbytes
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('chunk_sizes', ((1, 7, 1021), (1000, 4096), (2**16, 2**20)))
+async def test_protocol_parses_fragmented_stream(chunk_sizes):
+    protocol = WRPProtocol()
+    protocol.connection_made(FakeTransport())
+    messages = [Message.create_message(Message.Type.OK)]
+    for shape in ((60, 80), (512, 640), (1, 1), (256, 320)):
+        messages.append(Message.create_message(
+            Message.Type.FRAME,
+            frame_number=len(messages),
+            frame_timestamp=len(messages),
+            frame=(np.random.random(shape) * 100).astype(np.float32)))
+    messages.append(Message.create_message(
+        Message.Type.ERROR, error_code=1))
+
+    data = b''.join(bytes(m.encode()) for m in messages)
+    for i in range(2):
+        feed(protocol, data, chunk_sizes)
+        for expected in messages:
+            received = await protocol.receive()
+            assert received.msg_type == expected.msg_type
+            assert bytes(received.encode()) == bytes(expected.encode())
@@ -0,0 +1,144 @@
+from wrpclient.message import Message
+import pytest
+import numpy as np
+import struct
+
+
+def encode_frame_payload(frame_number, frame_timestamp, frame):
+    frame_height, frame_width = frame.shape
+    return struct.pack(">IQHH", frame_number, frame_timestamp, frame_height, frame_width) + \
+        struct.pack(f">{frame_height*frame_width}f", *frame.flatten())
+
+
+@pytest.mark.parametrize('shape', ((1, 1), (60, 80), (512, 640)))
+def test_decode_frame(shape):
+    frame = (np.random.random(shape) * 100).astype(np.float32)
+    payload = encode_frame_payload(7, 2**40, frame)
+    msg = Message.create_message_from_buffer(
+        message_type_value=Message.Type.FRAME.value,
+        payload=payload,
+        payload_length=len(payload))
+    decoded_frame = getattr(msg, Message.FRAME_ATTR_NAME)
+    assert decoded_frame.dtype == np.float32
+    assert decoded_frame.dtype.isnative
+    assert np.array_equal(decoded_frame, frame)
+    assert getattr(msg, Message.FRAME_NUMBER_ATTR_NAME) == 7
+    assert getattr(msg, Message.FRAME_TIMESTAMP_ATTR_NAME) == 2**40
+
+
+def test_decode_frame_keep_big_endian():
+    frame = (np.random.random((60, 80)) * 100).astype(np.float32)
+    payload = bytearray(encode_frame_payload(1, 1, frame))
+    msg = Message.create_message_from_buffer(
+        message_type_value=Message.Type.FRAME.value,
+        payload=memoryview(payload),
+        payload_length=len(payload),
+        keep_big_endian=True)
+    decoded_frame = getattr(msg, Message.FRAME_ATTR_NAME)
+    assert decoded_frame.dtype == Message.FRAME_WIRE_DTYPE
+    assert np.shares_memory(decoded_frame, np.frombuffer(payload, dtype=np.uint8))
+    assert np.array_equal(decoded_frame, frame)
+
+
+def test_decode_frame_too_short_payload():
+    frame = np.zeros((10, 10), dtype=np.float32)
+    payload = encode_frame_payload(1, 1, frame)[:-4]
+    with pytest.raises(ValueError):
+        Message.create_message_from_buffer(
+            message_type_value=Message.Type.FRAME.value,
+            payload=payload,
+            payload_length=len(payload))
+
+
+def encode_message_legacy(message_type, payload_content=bytes()):
+    # Reference encoder packing every byte of the payload separately
+    buffer = struct.pack(">B", message_type.value)
+    buffer += struct.pack(">I", len(payload_content))
+    buffer += struct.pack(f">{len(payload_content)}B", *payload_content)
+    return buffer
+
+
+@pytest.mark.parametrize('message_type', (
+    Message.Type.OK,
+    Message.Type.GET_CAMERA_LIST,
+    Message.Type.CLOSE_CAMERA,
+    Message.Type.GET_FRAME,
+    Message.Type.START_CONTINUOUS_GRABBING,
+    Message.Type.STOP_CONTINUOUS_GRABBING))
+def test_encode_empty_message(message_type):
+    msg = Message.create_message(message_type)
+    assert bytes(msg.encode()) == encode_message_legacy(message_type)
+
+
+def test_encode_error():
+    msg = Message.create_message(Message.Type.ERROR, error_code=3)
+    assert bytes(msg.encode()) == encode_message_legacy(
+        Message.Type.ERROR, struct.pack(">B", 3))
+
+
+@pytest.mark.parametrize('message_type, attr_name', (
+    (Message.Type.CAMERA_LIST, Message.XML_CAMERA_LIST_ATTR_NAME),
+    (Message.Type.OPEN_CAMERA, Message.CAMERA_SERIAL_NUMBER_ATTR_NAME)))
+def test_encode_string(message_type, attr_name):
+    value = "<Cameras><Camera SerialNumber=\"ABC\"/></Cameras>"
+    msg = Message.create_message(message_type, **{attr_name: value})
+    assert bytes(msg.encode()) == encode_message_legacy(
+        message_type, value.encode('ASCII'))
+
+
+def test_encode_ack_continuous_grabbing():
+    msg = Message.create_message(
+        Message.Type.ACK_CONTINUOUS_GRABBING, frame_number=2**32 - 1)
+    assert bytes(msg.encode()) == encode_message_legacy(
+        Message.Type.ACK_CONTINUOUS_GRABBING, struct.pack(">I", 2**32 - 1))
+
+
+@pytest.mark.parametrize('shape', ((1, 1), (60, 80), (512, 640)))
+def test_encode_frame(shape):
+    frame = (np.random.random(shape) * 100).astype(np.float32)
+    msg = Message.create_message(
+        Message.Type.FRAME, frame_number=5, frame_timestamp=2**63, frame=frame)
+    assert bytes(msg.encode()) == encode_message_legacy(
+        Message.Type.FRAME, encode_frame_payload(5, 2**63, frame))
+
+
+@pytest.mark.parametrize('shape', ((1, 1), (60, 80)))
+def test_encode_frame_round_trip(shape):
+    frame = np.asfortranarray(
+        (np.random.random(shape) * 100).astype(np.float32))
+    buffer = Message.create_message(
+        Message.Type.FRAME, frame_number=5, frame_timestamp=10, frame=frame).encode()
+    message_type_value, payload_length = Message.HEADER_STRUCT.unpack_from(
+        buffer)
+    msg = Message.create_message_from_buffer(
+        message_type_value=message_type_value,
+        payload=buffer[Message.HEADER_STRUCT.size:],
+        payload_length=payload_length)
+    assert np.array_equal(getattr(msg, Message.FRAME_ATTR_NAME), frame)
+
+
+@pytest.mark.parametrize('message', (
+    Message.create_message(Message.Type.OK),
+    Message.create_message(Message.Type.ERROR, error_code=1),
+    Message.create_message(Message.Type.CAMERA_LIST,
+                           xml_camera_list="<Cameras></Cameras>"),
+    Message.create_message(Message.Type.OPEN_CAMERA, camera_serial="ABC"),
+    Message.create_message(Message.Type.ACK_CONTINUOUS_GRABBING,
+                           frame_number=3),
+    Message.create_message(Message.Type.FRAME, frame_number=3, frame_timestamp=4,
+                           frame=np.ones((60, 80), dtype=np.float32))))
+@pytest.mark.parametrize('keep_big_endian', (False, True))
+def test_received_message_is_encoded_lazily(message, keep_big_endian):
+    buffer = bytes(message.encode())
+    header_size = Message.HEADER_STRUCT.size
+    payload = bytearray(buffer[header_size:])
+    msg = Message.create_message_from_buffer(
+        message_type_value=buffer[0],
+        payload=payload,
+        payload_length=len(payload),
+        keep_big_endian=keep_big_endian)
+    if(not keep_big_endian):
+        # Received message must not keep the payload alive
+        payload[:] = bytes(len(payload))
+    assert bytes(msg.encode()) == buffer
+    assert repr(msg) == repr(message)
@@ -1,4 +1,5 @@
 from wrpclient import Client
+from wrpclient.driver import Driver, BufferedDriver
 from wrpserver import WRPServer
 import pytest
 import numpy as np
@@ -94,8 +95,9 @@ async def test_open_and_close_async(wrp_server):
 
 
 @pytest.mark.asyncio
-async def test_get_frame_async(wrp_server):
-    client = Client()
+@pytest.mark.parametrize('driver_class', (Driver, BufferedDriver))
+async def test_get_frame_async(wrp_server, driver_class):
+    client = Client(driver_class=driver_class)
     await client.connect_async(ip_address=WRPServer.SERVER_IP_ADDRESS, port=WRPServer.DEFAULT_PORT)
     camera_list_server = WRPServer.generate_random_valid_camera_list(20)
     wrp_server.camera_list = camera_list_server
@@ -112,3 +114,34 @@ async def test_get_frame_async(wrp_server):
             assert client_frame_timestamp == server_frame_timestamp
         await camera.close_async()
     await client.disconnect_async()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('driver_class', (Driver, BufferedDriver))
+@pytest.mark.parametrize('max_queue_size', (1, 8))
+async def test_stream_async(wrp_server, driver_class, max_queue_size):
+    client = Client(driver_class=driver_class)
+    await client.connect_async(ip_address=WRPServer.SERVER_IP_ADDRESS, port=WRPServer.DEFAULT_PORT)
+    camera = (await client.get_cameras_async())[0]
+    await camera.open_async()
+    for repeat in range(2):
+        received = []
+        stream = camera.stream(max_queue_size=max_queue_size)
+        async for frame, frame_number, frame_timestamp in stream:
+            received.append((frame, frame_number, frame_timestamp))
+            if(len(received) == 50):
+                break
+        await stream.aclose()
+
+        for (frame, frame_number, frame_timestamp), frame_dict in zip(
+                received, wrp_server.continuous_frames):
+            assert np.array_equal(frame, frame_dict['frame'])
+            assert frame_number == frame_dict['frame_number']
+            assert frame_timestamp == frame_dict['frame_timestamp']
+
+    # Connection must stay usable after the continuous grabbing
+    wrp_server.frame_dict = WRPServer.generate_random_frame(camera)
+    client_frame, client_frame_timestamp = await camera.get_frame_async()
+    assert np.array_equal(client_frame, wrp_server.frame_dict['frame'])
+    await camera.close_async()
+    await client.disconnect_async()
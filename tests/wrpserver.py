@@ -1,7 +1,6 @@
 import asyncio
 from enum import Enum, unique
 import numpy as np
-import struct
 import xml.etree.ElementTree as ET
 from message import Message
 import random
@@ -48,6 +47,10 @@ class WRPServer:
         self.port = port
         self.camera_list = WRPServer.generate_random_valid_camera_list(5)
         self.state = WRPServer.State.IDLE
+        # Period in seconds between frames sent in continuous grabbing
+        self.continuous_period = 0
+        self.continuous_frames = []
+        self.continuous_task = None
 
     async def __handle_server_exception__(self):
         async with self.server as s:
@@ -65,14 +68,43 @@ class WRPServer:
 
     async def routine(self, reader, writer):
         self.state = WRPServer.State.CONNECTED
+        try:
+            while(True):
+                print("Server: Waiting for the message...")
+                message = await WRPServer.receive_message(reader)
+                if(message.msg_type == Message.Type.STOP_CONTINUOUS_GRABBING):
+                    # All the frames must be sent before the response
+                    await self.stop_continuous_grabbing()
+                message_to_send = self.handle_message(message)
+                if(message_to_send is not None):
+                    await WRPServer.send_message(writer, message_to_send)
+                else:
+                    print("No response to be sent was generated")
+                if(self.state == WRPServer.State.CONTINUOUS_GRABBING and self.continuous_task is None):
+                    self.continuous_task = asyncio.create_task(
+                        self.continuous_grabbing(writer))
+        finally:
+            await self.stop_continuous_grabbing()
+
+    async def continuous_grabbing(self, writer):
+        self.continuous_frames = []
+        frame_number = 0
         while(True):
-            print("Server: Waiting for the message...")
-            message = await WRPServer.receive_message(reader)
-            message_to_send = self.handle_message(message)
-            if(message_to_send is not None):
-                await WRPServer.send_message(writer, message_to_send)
-            else:
-                print("No response to be sent was generated")
+            frame_dict = WRPServer.generate_random_frame(self.camera_selected)
+            frame_dict[Message.FRAME_NUMBER_ATTR_NAME] = frame_number
+            self.continuous_frames.append(frame_dict)
+            await WRPServer.send_message(writer, Message.create_message(Message.Type.FRAME, **frame_dict))
+            frame_number += 1
+            await asyncio.sleep(self.continuous_period)
+
+    async def stop_continuous_grabbing(self):
+        if(self.continuous_task is not None):
+            self.continuous_task.cancel()
+            try:
+                await self.continuous_task
+            except asyncio.CancelledError:
+                pass
+            self.continuous_task = None
 
     async def stop(self):
         self.server.close()
@@ -129,6 +161,22 @@ class WRPServer:
             else:
                 to_send = Message.create_message(
                     Message.Type.ERROR, error_code=Message.ErrorCode.UNEXPECTED_MESSAGE)
+
+        elif(message.msg_type == Message.Type.START_CONTINUOUS_GRABBING):
+            if(self.state == WRPServer.State.CAMERA_SELECTED):
+                self.state = WRPServer.State.CONTINUOUS_GRABBING
+                to_send = Message.create_message(Message.Type.OK)
+            else:
+                to_send = Message.create_message(
+                    Message.Type.ERROR, error_code=Message.ErrorCode.UNEXPECTED_MESSAGE)
+
+        elif(message.msg_type == Message.Type.STOP_CONTINUOUS_GRABBING):
+            if(self.state == WRPServer.State.CONTINUOUS_GRABBING):
+                self.state = WRPServer.State.CAMERA_SELECTED
+                to_send = Message.create_message(Message.Type.OK)
+            else:
+                to_send = Message.create_message(
+                    Message.Type.ERROR, error_code=Message.ErrorCode.UNEXPECTED_MESSAGE)
         else:
             print(f"Unhandled message type {message.msg_type}")
         return to_send
@@ -141,7 +189,7 @@ class WRPServer:
 
     @staticmethod
     async def receive_message(reader):
-        message_type_value, payload_length = struct.unpack(">BI", await reader.readexactly(Message.MESSAGE_TYPE_LENGTH + Message.PAYLOAD_SIZE_LENGTH))
+        message_type_value, payload_length = Message.HEADER_STRUCT.unpack(await reader.readexactly(Message.HEADER_STRUCT.size))
         print(
             f"Server: Received message type value: {message_type_value}, payload_length: {payload_length}")
         if(payload_length > 0):
@@ -6,6 +6,7 @@ class Camera:
     '''
 
     DEFAULT_TIMEOUT = 10
+    DEFAULT_STREAM_QUEUE_SIZE = 8
     # Keys are names in C# SDK, values are names of the attributes in Python
     ATTRIBUTES = {
         'SerialNumber': ('serial_number', str),
@@ -202,7 +203,7 @@ class Camera:
 
         None
         '''
-        return await self.__connector.start_continuous_shot(self.serial_number, callback)
+        return await self.__connector.start_continuous_shot_async(self.serial_number, callback)
 
     async def stop_continuous_shot_async(self):
         '''
@@ -219,4 +220,29 @@ class Camera:
 
         None
         '''
-        return await self.__connector.stop_continuous_shot(self.serial_number)
+        return await self.__connector.stop_continuous_shot_async(self.serial_number)
+
+    def stream(self, max_queue_size=DEFAULT_STREAM_QUEUE_SIZE):
+        '''
+
+        Start continuous grabbing from the camera and return asynchronous generator of the received frames. Continuous grabbing is stopped when the generator is closed.
+        Frames are read from the server by a single task in the event loop and passed through a bounded queue, so a slow consumer suspends reading from the server instead of accumulating frames in the memory.
+        `ValueError exception <https://docs.python.org/3/library/exceptions.html#ValueError>`_  is raised when camera is not connected first or it is already in continuous grabbing state.
+
+        .. code-block:: python
+
+            async with contextlib.aclosing(camera.stream()) as stream:
+                async for frame, frame_number, frame_timestamp in stream:
+                    ...
+
+        **Params**
+
+        * max_queue_size: int, maximal number of received frames waiting for the consumer
+
+        **Return**
+
+        asynchronous generator of tuples (frame, frame_number, frame_timestamp), where frame is 2-dimensional numpy matrix with dtype float32 containing temperature values in °C
+        '''
+        return self.__connector.stream_async(
+            self.serial_number, max_queue_size)
+
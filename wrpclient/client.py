@@ -1,3 +1,4 @@
+from .driver import Driver
 from .wrp_connector import WRPConnector
 
 
@@ -8,8 +9,13 @@ class Client:
     DEFAULT_TIMEOUT = 10
     DEFAULT_PORT = 8754
 
-    def __init__(self):
-        self.__connector = WRPConnector()
+    def __init__(self, driver_class=Driver):
+        '''
+        **Params**
+
+        * driver_class: class implementing the transport, :class:`wrpclient.driver.Driver` based on asyncio streams or :class:`wrpclient.driver.BufferedDriver` that receives the messages into a reusable buffer
+        '''
+        self.__connector = WRPConnector(driver_class)
 
     def connect(self, ip_address, port=DEFAULT_PORT, timeout=DEFAULT_TIMEOUT):
         '''
@@ -1,5 +1,6 @@
-import struct
+import collections
 import asyncio
+import numpy as np
 from .message import Message
 
 
@@ -25,7 +26,7 @@ class Driver:
         await self.__writer.drain()
 
     async def receive_message(self):
-        message_type_value, payload_length = struct.unpack(">BI", await self.__reader.readexactly(Message.MESSAGE_TYPE_LENGTH + Message.PAYLOAD_SIZE_LENGTH))
+        message_type_value, payload_length = Message.HEADER_STRUCT.unpack(await self.__reader.readexactly(Message.HEADER_STRUCT.size))
         if(payload_length > 0):
             payload = await self.__reader.readexactly(payload_length)
         else:
@@ -35,3 +36,192 @@ class Driver:
             payload=payload,
             payload_length=payload_length)
         return response
+
+
+class WRPProtocol(asyncio.BufferedProtocol):
+    '''
+    Protocol that receives data from the socket directly into one reusable buffer and parses WRP messages in place.
+    '''
+    INITIAL_BUFFER_SIZE = 2**16
+    # Reading from the socket is paused when this number of parsed messages is not consumed
+    MAX_PENDING_MESSAGES = 64
+
+    def __init__(self):
+        self.__event_loop = asyncio.get_event_loop()
+        self.__transport = None
+        self.__buffer = bytearray(WRPProtocol.INITIAL_BUFFER_SIZE)
+        self.__view = memoryview(self.__buffer)
+        # Received but not parsed data are stored in self.__buffer[self.__start:self.__end]
+        self.__start = 0
+        self.__end = 0
+        self.__messages = collections.deque()
+        self.__receive_waiter = None
+        self.__drain_waiters = collections.deque()
+        self.__reading_paused = False
+        self.__writing_paused = False
+        self.__exception = None
+        self.__closed = self.__event_loop.create_future()
+
+    def connection_made(self, transport):
+        self.__transport = transport
+
+    def connection_lost(self, exc):
+        if(exc is None):
+            exc = ConnectionResetError("Connection was closed")
+        self.__set_exception(exc)
+        for waiter in self.__drain_waiters:
+            if(not waiter.done()):
+                waiter.set_exception(exc)
+        self.__drain_waiters.clear()
+        if(not self.__closed.done()):
+            self.__closed.set_result(None)
+
+    def pause_writing(self):
+        self.__writing_paused = True
+
+    def resume_writing(self):
+        self.__writing_paused = False
+        for waiter in self.__drain_waiters:
+            if(not waiter.done()):
+                waiter.set_result(None)
+        self.__drain_waiters.clear()
+
+    def get_buffer(self, sizehint):
+        if(self.__end == len(self.__buffer)):
+            self.__reserve(self.__end - self.__start + 1)
+        return self.__view[self.__end:]
+
+    def buffer_updated(self, nbytes):
+        self.__end += nbytes
+        header_size = Message.HEADER_STRUCT.size
+        while(self.__end - self.__start >= header_size):
+            message_type_value, payload_length = Message.HEADER_STRUCT.unpack_from(
+                self.__buffer, self.__start)
+            message_end = self.__start + header_size + payload_length
+            if(message_end > self.__end):
+                # Make sure that the rest of the message fits into the buffer
+                self.__reserve(header_size + payload_length)
+                break
+            try:
+                message = Message.create_message_from_buffer(
+                    message_type_value=message_type_value,
+                    payload=self.__view[self.__start + header_size:message_end],
+                    payload_length=payload_length)
+            except Exception as e:
+                self.__set_exception(e)
+                self.__transport.close()
+                return
+            self.__start = message_end
+            self.__deliver(message)
+
+        if(self.__start == self.__end):
+            self.__start = self.__end = 0
+
+    async def receive(self):
+        '''
+        Return the oldest received message or wait for the next one.
+
+        **Params**
+
+        None
+
+        **Return**
+
+        instance of :class:`Message`
+        '''
+        if(self.__messages):
+            message = self.__messages.popleft()
+            if(self.__reading_paused and len(self.__messages) <= WRPProtocol.MAX_PENDING_MESSAGES // 2):
+                self.__reading_paused = False
+                self.__transport.resume_reading()
+            return message
+        if(self.__exception is not None):
+            raise self.__exception
+        self.__receive_waiter = self.__event_loop.create_future()
+        try:
+            return await self.__receive_waiter
+        finally:
+            self.__receive_waiter = None
+
+    async def drain(self):
+        '''
+        Wait until the transport's write buffer is flushed under its high-water mark.
+
+        **Params**
+
+        None
+
+        **Return**
+
+        None
+        '''
+        if(self.__exception is not None):
+            raise self.__exception
+        if(not self.__writing_paused):
+            return
+        waiter = self.__event_loop.create_future()
+        self.__drain_waiters.append(waiter)
+        await waiter
+
+    async def wait_closed(self):
+        await self.__closed
+
+    def __deliver(self, message):
+        if(self.__receive_waiter is not None and not self.__receive_waiter.done()):
+            self.__receive_waiter.set_result(message)
+            return
+        self.__messages.append(message)
+        if(not self.__reading_paused and len(self.__messages) >= WRPProtocol.MAX_PENDING_MESSAGES):
+            self.__reading_paused = True
+            self.__transport.pause_reading()
+
+    def __set_exception(self, exc):
+        if(self.__exception is None):
+            self.__exception = exc
+        if(self.__receive_waiter is not None and not self.__receive_waiter.done()):
+            self.__receive_waiter.set_exception(exc)
+
+    def __reserve(self, size):
+        # Ensures that the buffer starting at self.__start can hold size bytes.
+        # The buffer is exported by memoryviews, so instead of resizing it
+        # a bigger one is allocated when the message does not fit at all.
+        pending = self.__end - self.__start
+        if(len(self.__buffer) - self.__start >= size):
+            return
+        if(len(self.__buffer) >= size):
+            data = np.frombuffer(self.__buffer, dtype=np.uint8)
+            data[:pending] = data[self.__start:self.__end]
+        else:
+            buffer = bytearray(max(size, 2 * len(self.__buffer)))
+            buffer[:pending] = self.__view[self.__start:self.__end]
+            self.__buffer = buffer
+            self.__view = memoryview(buffer)
+        self.__start = 0
+        self.__end = pending
+
+
+class BufferedDriver:
+    '''
+    Alternative to :class:`Driver` built on top of :class:`WRPProtocol`. Messages are parsed directly from the reusable receive buffer, so no intermediate bytes objects are allocated for each frame.
+    '''
+
+    def __init__(self):
+        self.__event_loop = asyncio.get_event_loop()
+        self.__transport = None
+        self.__protocol = None
+
+    async def connect(self, ip_address, port):
+        self.__transport, self.__protocol = await asyncio.get_event_loop().create_connection(WRPProtocol, ip_address, port)
+
+    async def disconnect(self):
+        self.__transport.close()
+        await self.__protocol.wait_closed()
+        self.__transport = None
+        self.__protocol = None
+
+    async def send_message(self, message):
+        self.__transport.write(message.encode())
+        await self.__protocol.drain()
+
+    async def receive_message(self):
+        return await self.__protocol.receive()
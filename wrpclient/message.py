@@ -20,6 +20,11 @@ class Message:
     FRAME_TIMESTAMP_ATTR_NAME = 'frame_timestamp'
     FRAME_ATTR_NAME = 'frame'
 
+    # Pixels of the frame are transferred as big-endian 32-bit floats
+    FRAME_WIRE_DTYPE = np.dtype('>f4')
+    # Precompiled structure of the message header (message type, payload length)
+    HEADER_STRUCT = struct.Struct(">BI")
+
     @unique
     class Type(Enum):
         INVALID = 0
@@ -36,11 +41,12 @@ class Message:
         ACK_CONTINUOUS_GRABBING = 11
 
     def __init__(self):
-        self.__buffer = bytearray()
+        self.__buffer = None
 
     def encode(self):
         '''
-        Encode message along its attributes (message type, payload etc.) to bytearray
+        Encode message along its attributes (message type, payload etc.) to bytearray.
+        Messages received from the socket are encoded lazily during the first call.
 
         **Params**
 
@@ -50,13 +56,64 @@ class Message:
 
         bytearray containing encoded message
         '''
+        if(self.__buffer is None):
+            self.__buffer = self.__pack()
         return self.__buffer
 
     def __repr__(self):
-        if(len(self.__buffer) > 500):
-            return f"{self.msg_type}({self.msg_type.value}), buffer (trimmed): {self.__buffer[:500]}"
+        buffer = self.encode()
+        if(len(buffer) > 500):
+            return f"{self.msg_type}({self.msg_type.value}), buffer (trimmed): {buffer[:500]}"
         else:
-            return f"{self.msg_type}({self.msg_type.value}), buffer: {self.__buffer}"
+            return f"{self.msg_type}({self.msg_type.value}), buffer: {buffer}"
+
+    def __pack(self):
+        # Packs the message type and the attributes specific for it to the
+        # bytearray. Whole message is written into one preallocated buffer,
+        # the frame is byte-swapped to the wire format directly into its place
+        payload_content = bytes()
+        frame = None
+        t = Message.Type
+        if(self.msg_type == t.ERROR):
+            payload_content = struct.pack(
+                ">B", getattr(self, Message.ERROR_CODE_ATTR_NAME))
+
+        elif(self.msg_type == t.CAMERA_LIST):
+            payload_content = getattr(
+                self, Message.XML_CAMERA_LIST_ATTR_NAME).encode('ASCII')
+
+        elif(self.msg_type == t.OPEN_CAMERA):
+            payload_content = getattr(
+                self, Message.CAMERA_SERIAL_NUMBER_ATTR_NAME).encode('ASCII')
+
+        elif(self.msg_type in [t.FRAME, t.ACK_CONTINUOUS_GRABBING]):
+            payload_content = struct.pack(
+                ">I", getattr(self, Message.FRAME_NUMBER_ATTR_NAME))
+            if(self.msg_type == t.FRAME):
+                frame = getattr(self, Message.FRAME_ATTR_NAME)
+                frame_height, frame_width = frame.shape
+                payload_content += struct.pack(
+                    ">QHH",
+                    getattr(self, Message.FRAME_TIMESTAMP_ATTR_NAME),
+                    frame_height,
+                    frame_width)
+
+        header_size = Message.HEADER_STRUCT.size
+        payload_length = len(payload_content)
+        if(frame is not None):
+            payload_length += frame.size * Message.FRAME_WIRE_DTYPE.itemsize
+        buffer = bytearray(header_size + payload_length)
+        Message.HEADER_STRUCT.pack_into(
+            buffer, 0, self.msg_type.value, payload_length)
+        buffer[header_size:header_size + len(payload_content)] = payload_content
+        if(frame is not None):
+            np.frombuffer(
+                buffer,
+                dtype=Message.FRAME_WIRE_DTYPE,
+                count=frame.size,
+                offset=header_size + len(payload_content)).reshape(
+                frame.shape)[...] = frame
+        return buffer
 
     @staticmethod
     def is_int_valid_message_type(message_type_value):
@@ -110,16 +167,20 @@ class Message:
     def create_message_from_buffer(
             message_type_value,
             payload=bytes(),
-            payload_length=0):
+            payload_length=0,
+            keep_big_endian=False):
         '''
         Static method that checks if the given message type and payload extracted from a socket correct and decompose it to attributes specific for each message type
         `ValueError exception <https://docs.python.org/3/library/exceptions.html#ValueError>`_  is raised when given payload's length and payload_length does not match according to WRP.
 
+        Frame of the FRAME message is viewed directly in the payload (without creating intermediate Python objects) and converted to the native byte order by a single vectorized copy.
+
         **Params**
 
         * message_type_value: int, code of the message type
-        * payload: bytes, extracted from the socket
+        * payload: bytes-like object (bytes, bytearray, memoryview), extracted from the socket
         * payload_length: int, length of the payload according to received bytes from the socket
+        * keep_big_endian: bool, if True, frame of the FRAME message is returned as a read-only view with dtype '>f4' into the payload instead of the native float32 copy
 
         **Return**
 
@@ -134,7 +195,7 @@ class Message:
 
         t = Message.Type
         already_read = 0
-        if(msg.msg_type in [t.OK, t.GET_CAMERA_LIST]):
+        if(msg.msg_type in [t.OK, t.GET_CAMERA_LIST, t.CLOSE_CAMERA, t.GET_FRAME, t.START_CONTINUOUS_GRABBING, t.STOP_CONTINUOUS_GRABBING]):
             pass
 
         elif(msg.msg_type == t.ERROR):
@@ -172,15 +233,17 @@ class Message:
                 setattr(msg, Message.FRAME_TIMESTAMP_ATTR_NAME, timestamp)
                 already_read += struct.calcsize(">QHH")
 
-                frame_flatten = struct.unpack_from(
-                    f">{frame_height*frame_width}f", payload, already_read)
-                frame = np.array(
-                    frame_flatten,
-                    dtype=np.float32).reshape(
+                frame = np.frombuffer(
+                    payload,
+                    dtype=Message.FRAME_WIRE_DTYPE,
+                    count=frame_height * frame_width,
+                    offset=already_read).reshape(
                     frame_height,
                     frame_width)
+                if(not keep_big_endian):
+                    frame = frame.astype(np.float32)
                 setattr(msg, Message.FRAME_ATTR_NAME, frame)
-                already_read += struct.calcsize(f"{frame_height*frame_width}f")
+                already_read += frame.nbytes
 
         else:
             raise ValueError(f"Unknown message type {msg.msg_type}")
@@ -189,10 +252,8 @@ class Message:
             raise ValueError(
                 f"Deserialization of the message is finished, but no all bytes in payload were used. "
                 f"payload_length={payload_length}, number of read bytes={already_read}, message type={msg.msg_type}")
-        msg.__buffer = struct.pack(
-            f">BI",
-            message_type_value,
-            payload_length) + payload
+        # Received message keeps no reference to the payload, the buffer is
+        # packed again from the decoded attributes only if it is ever needed
         return msg
 
     @staticmethod
@@ -215,9 +276,7 @@ class Message:
                 "Parameter message_type must be type Message.Type")
         msg = Message()
         msg.msg_type = message_type
-        msg.__buffer = struct.pack(">B", msg.msg_type.value)
 
-        payload_content = bytes()
         t = Message.Type
         if(msg.msg_type in [t.OK, t.GET_CAMERA_LIST, t.CLOSE_CAMERA, t.GET_FRAME, t.START_CONTINUOUS_GRABBING, t.STOP_CONTINUOUS_GRABBING]):
             pass
@@ -228,30 +287,20 @@ class Message:
                     f"Parameter '{Message.ERROR_CODE_ATTR_NAME}'	 must be given for message with type {msg.msg_type}")
             setattr(msg, Message.ERROR_CODE_ATTR_NAME,
                     kwargs[Message.ERROR_CODE_ATTR_NAME])
-            payload_content += struct.pack(">B",
-                                           getattr(msg,
-                                                   Message.ERROR_CODE_ATTR_NAME))
 
         elif(msg.msg_type == t.CAMERA_LIST):
             if(Message.XML_CAMERA_LIST_ATTR_NAME not in kwargs):
                 raise ValueError(
                     f"Parameter '{Message.XML_CAMERA_LIST_ATTR_NAME}' must be given for message with type {msg.msg_type}")
-            xml = kwargs[Message.XML_CAMERA_LIST_ATTR_NAME]
-            setattr(msg, Message.XML_CAMERA_LIST_ATTR_NAME, xml)
-            xml_encoded = xml.encode('ASCII')
-            payload_content += struct.pack(
-                f">{len(xml_encoded)}s", xml_encoded)
+            setattr(msg, Message.XML_CAMERA_LIST_ATTR_NAME,
+                    kwargs[Message.XML_CAMERA_LIST_ATTR_NAME])
 
         elif(msg.msg_type == t.OPEN_CAMERA):
             if(Message.CAMERA_SERIAL_NUMBER_ATTR_NAME not in kwargs):
                 raise ValueError(
                     f"Parameter '{Message.CAMERA_SERIAL_NUMBER_ATTR_NAME}' must be given for message with type {msg.msg_type}")
-            serial_number = kwargs[Message.CAMERA_SERIAL_NUMBER_ATTR_NAME]
-            setattr(msg, Message.CAMERA_SERIAL_NUMBER_ATTR_NAME, serial_number)
-            serial_number_encoded = serial_number.encode('ASCII')
-            payload_content += struct.pack(
-                f">{len(serial_number_encoded)}s",
-                serial_number_encoded)
+            setattr(msg, Message.CAMERA_SERIAL_NUMBER_ATTR_NAME,
+                    kwargs[Message.CAMERA_SERIAL_NUMBER_ATTR_NAME])
 
         elif(msg.msg_type in [t.FRAME, t.ACK_CONTINUOUS_GRABBING]):
             if(msg.msg_type in [t.FRAME, t.ACK_CONTINUOUS_GRABBING]):
@@ -260,8 +309,6 @@ class Message:
                         f"Parameter '{Message.FRAME_NUMBER_ATTR_NAME}' must be given for message with type {msg.msg_type}")
                 setattr(msg, Message.FRAME_NUMBER_ATTR_NAME,
                         kwargs[Message.FRAME_NUMBER_ATTR_NAME])
-                payload_content += struct.pack(f">I",
-                                               kwargs[Message.FRAME_NUMBER_ATTR_NAME])
 
             if(msg.msg_type == t.FRAME):
                 if(Message.FRAME_TIMESTAMP_ATTR_NAME not in kwargs):
@@ -269,8 +316,6 @@ class Message:
                         f"Parameter '{Message.FRAME_TIMESTAMP_ATTR_NAME}' must be given for message with type {msg.msg_type}")
                 setattr(msg, Message.FRAME_TIMESTAMP_ATTR_NAME,
                         kwargs[Message.FRAME_TIMESTAMP_ATTR_NAME])
-                payload_content += struct.pack(f">Q",
-                                               kwargs[Message.FRAME_TIMESTAMP_ATTR_NAME])
 
                 if(Message.FRAME_ATTR_NAME not in kwargs):
                     raise ValueError(
@@ -283,18 +328,10 @@ class Message:
                 setattr(msg, Message.FRAME_ATTR_NAME,
                         kwargs[Message.FRAME_ATTR_NAME])
 
-                frame_height, frame_width = frame.shape
-                payload_content += struct.pack(f">HH",
-                                               frame_height, frame_width)
-                payload_content += struct.pack(
-                    f">{frame_height*frame_width}f", *frame.flatten())
-
         else:
             raise ValueError(f"Unknown message type {msg.msg_type}")
 
-        msg.__buffer += struct.pack(f">I", len(payload_content))
-        msg.__buffer += struct.pack(f">{len(payload_content)}B",
-                                    *payload_content)
+        msg.__buffer = msg.__pack()
         return msg
 
     @staticmethod
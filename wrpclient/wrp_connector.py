@@ -16,15 +16,18 @@ class WRPConnector:
         CAMERA_SELECTED = 3
         CONTINUOUS_GRABBING = 4
 
-    def __init__(self):
-        self.__driver = Driver()
+    DEFAULT_STREAM_QUEUE_SIZE = 8
+
+    def __init__(self, driver_class=Driver):
+        self.__driver = driver_class()
         self.__state = WRPConnector.State.IDLE
         self.__event_loop = asyncio.get_event_loop()
         self.__active_camera = None
         self.__continuous_shot_aborted = False
         self.__continuous_callback = None
         self.__continuous_thread = None
-        self.__continuous_last_message = None
+        self.__continuous_queue = None
+        self.__continuous_task = None
 
     def connect(self, ip_address, port, timeout):
         '''
@@ -189,10 +192,16 @@ class WRPConnector:
         '''
         self.__event_loop.run_until_complete(
             asyncio.wait_for(
-                self.start_continuous_shot_async(camera_serial_number),
+                self.start_continuous_shot_async(
+                    camera_serial_number, callback),
                 timeout=timeout
             )
         )
+        # Frames are received by the task in the event loop, so the loop has
+        # to run in its own thread until the continuous shot is stopped
+        self.__continuous_thread = threading.Thread(
+            target=self.__event_loop.run_forever, daemon=True)
+        self.__continuous_thread.start()
 
     def stop_continuous_shot(self, camera_serial_number, timeout):
         '''
@@ -207,12 +216,27 @@ class WRPConnector:
 
         None
         '''
-        self.__event_loop.run_until_complete(
-            asyncio.wait_for(
-                self.stop_continuous_shot_async(camera_serial_number),
-                timeout=timeout
+        if(self.__continuous_thread is None):
+            self.__event_loop.run_until_complete(
+                asyncio.wait_for(
+                    self.stop_continuous_shot_async(camera_serial_number),
+                    timeout=timeout
+                )
             )
-        )
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(
+                asyncio.wait_for(
+                    self.stop_continuous_shot_async(camera_serial_number),
+                    timeout=timeout
+                ),
+                self.__event_loop
+            ).result()
+        finally:
+            self.__event_loop.call_soon_threadsafe(self.__event_loop.stop)
+            self.__continuous_thread.join()
+            self.__continuous_thread = None
 
     async def connect_async(self, ip_address, port):
         '''
@@ -405,24 +429,27 @@ class WRPConnector:
             raise ValueError(
                 f"Server responded with unexpected message {response.msg_type}")
 
-    async def start_continuous_shot_async(self, camera_serial_number):
+    async def start_continuous_shot_async(
+            self,
+            camera_serial_number,
+            callback=None,
+            max_queue_size=DEFAULT_STREAM_QUEUE_SIZE):
         '''
         Asynchronously moves from state CAMERA_SELECTED to state CONTINUOUS_GRABBING.
+        Received frames are read by a single task in the event loop and put into a bounded queue. When the queue is full, reading from the socket is suspended.
 
         **Params**
 
         * camera_serial_number: str
+        * callback: callable or None
+        * max_queue_size: int, maximal number of received frames waiting for the consumer
 
         **Return**
 
         None
         '''
-        if(not callable(callback)):
+        if(callback is not None and not callable(callback)):
             raise ValueError("Given callback must be a callable")
-        self.__continuous_callback = callback
-        self.__continuous_thread = threading.Thread(
-            target=self.__handle_continuous_shot_state, args=(
-                self.__event_loop,))
 
         if(self.__state == WRPConnector.State.IDLE):
             raise ValueError(
@@ -444,13 +471,18 @@ class WRPConnector:
         if(response.msg_type == Message.Type.OK):
             self.__state = WRPConnector.State.CONTINUOUS_GRABBING
         elif(response.msg_type == Message.Type.ERROR):
-            error_code = getattr(response, ERROR_CODE_ATTR_NAME)
+            error_code = getattr(response, Message.ERROR_CODE_ATTR_NAME)
             self.__state = WRPConnector.State.CAMERA_SELECTED
             raise ValueError(f"Server responded with error code {error_code}")
         else:
             raise ValueError(
                 f"Server responded with unexpected message {response.msg_type}")
-        self.__continuous_thread.start()
+
+        self.__continuous_shot_aborted = False
+        self.__continuous_callback = callback
+        self.__continuous_queue = asyncio.Queue(maxsize=max_queue_size)
+        self.__continuous_task = asyncio.ensure_future(
+            self.__handle_continuous_shot_state_async())
 
     async def stop_continuous_shot_async(self, camera_serial_number):
         '''
@@ -478,49 +510,92 @@ class WRPConnector:
                 f"Camera with serial number {camera_serial_number} is not open")
 
         self.__continuous_shot_aborted = True
-        request = Message.create_message(
-            message_type=Message.Type.STOP_CONTINUOUS_GRABBING)
-        await self.__driver.send_message(request)
-        self.__continuous_thread.join()
-
-        if(self.__continuous_last_message is not None):
-            if(self.__continuous_last_message.msg_type == Message.Type.OK):
-                self.__state = WRPConnector.State.CAMERA_SELECTED
-            elif(self.__continuous_last_message.msg_type == Message.Type.ERROR):
-                error_code = getattr(
-                    self.__continuous_last_message,
-                    ERROR_CODE_ATTR_NAME)
-                self.__state = WRPConnector.State.CONTINUOUS_GRABBING
-                raise ValueError(
-                    f"Server responded with error code {error_code}")
-            else:
-                raise ValueError(
-                    f"Server responded with unexpected message {self.__continuous_last_message.msg_type}")
+        if(not self.__continuous_task.done()):
+            request = Message.create_message(
+                message_type=Message.Type.STOP_CONTINUOUS_GRABBING)
+            await self.__driver.send_message(request)
+            # Frames received after the request are dropped, but the task may
+            # already wait for a free place in the full queue
+            self.__clear_continuous_queue()
+
+        try:
+            last_message = await self.__continuous_task
+        finally:
+            self.__close_continuous_queue()
+            self.__continuous_task = None
+            self.__continuous_callback = None
+
+        if(last_message.msg_type == Message.Type.OK):
+            self.__state = WRPConnector.State.CAMERA_SELECTED
+        elif(last_message.msg_type == Message.Type.ERROR):
+            error_code = getattr(last_message, Message.ERROR_CODE_ATTR_NAME)
+            self.__state = WRPConnector.State.CAMERA_SELECTED
+            raise ValueError(
+                f"Server responded with error code {error_code}")
         else:
             raise ValueError(
-                f"Server has not responded to STOP_CONTINUOUS_GRABBING message")
+                f"Server responded with unexpected message {last_message.msg_type}")
 
-        self.__continuous_thread = None
-        self.__continuous_callback = None
-        self.__last_continuous_message = None
+    async def stream_async(
+            self,
+            camera_serial_number,
+            max_queue_size=DEFAULT_STREAM_QUEUE_SIZE):
+        '''
+        Asynchronous generator that starts the continuous shot and yields received frames until it is closed.
+        The continuous shot is stopped when the generator is closed (e.g. by `contextlib.aclosing <https://docs.python.org/3/library/contextlib.html#contextlib.aclosing>`_ or when it is garbage collected).
+        Frames are yielded in the order they were received, the server is not read from while max_queue_size frames wait for the consumer.
 
-    def __handle_continuous_shot_state(self, event_loop):
-        asyncio.set_event_loop(event_loop)
-        event_loop.run_until_complete(
-            self.__handle_continuous_shot_state_async())
+        **Params**
 
-    async def __handle_continuous_shot_state_async(self):
-        while(True):
-            response = await self.__driver.receive_message()
-            if(response.msg_type in [Message.Type.OK, Message.Type.ERROR]):
-                if(self.__continuous_shot_aborted):
-                    self.__continuous_last_message = response
+        * camera_serial_number: str
+        * max_queue_size: int, maximal number of received frames waiting for the consumer
+
+        **Return**
+
+        asynchronous generator of tuples (frame, frame_number, frame_timestamp)
+        '''
+        await self.start_continuous_shot_async(camera_serial_number, max_queue_size=max_queue_size)
+        queue = self.__continuous_queue
+        try:
+            while(True):
+                item = await queue.get()
+                if(item is None):
                     break
+                yield item
+        finally:
+            if(self.__continuous_task is not None):
+                await self.stop_continuous_shot_async(camera_serial_number)
+
+    async def __handle_continuous_shot_state_async(self):
+        queue = self.__continuous_queue
+        try:
+            while(True):
+                response = await self.__driver.receive_message()
+                if(response.msg_type in [Message.Type.OK, Message.Type.ERROR]):
+                    if(self.__continuous_shot_aborted):
+                        return response
+                    else:
+                        raise ValueError(
+                            f"Server responded with unexpected message {response.msg_type} when continuous shot was not aborted")
+                elif(response.msg_type == Message.Type.FRAME):
+                    if(not self.__continuous_shot_aborted):
+                        await queue.put((
+                            getattr(response, Message.FRAME_ATTR_NAME),
+                            getattr(response, Message.FRAME_NUMBER_ATTR_NAME),
+                            getattr(response, Message.FRAME_TIMESTAMP_ATTR_NAME)))
                 else:
                     raise ValueError(
-                        f"Server responded with unexpected message {response.msg_type} when continuous shot was not aborted")
-            elif(response.msg_type == Message.Type.FRAME):
-                pass
-            else:
-                raise ValueError(
-                    f"Server responded with unexpected message {response.msg_type}")
+                        f"Server responded with unexpected message {response.msg_type}")
+        except BaseException:
+            # Wake up the consumer waiting for the next frame
+            self.__close_continuous_queue()
+            raise
+
+    def __clear_continuous_queue(self):
+        while(not self.__continuous_queue.empty()):
+            self.__continuous_queue.get_nowait()
+
+    def __close_continuous_queue(self):
+        # None put into the queue marks the end of the continuous shot
+        self.__clear_continuous_queue()
+        self.__continuous_queue.put_nowait(None)